@@ -4,12 +4,21 @@ import os
 import zipfile
 import zlib
 import io
+import numbers
+import time
 from fuzzywuzzy import process
 
 # Constants
 NUM_TOP_ROUTES_PROMPT = 20
 NUM_WORLDWIDE_ROUTES = 100
 NUM_RESULTS_TO_PICK = 500
+NUM_ITEM_PORTS_PROMPT = 5
+
+# Data files
+ITEMS_BY_PORT_FILE = 'ITEMS_BY_PORT.csv'
+ITEM_VALUE_BY_REGION_FILE = 'ITEM_VALUE_BY_REGION.csv'
+GLOBAL_ROUTES_FILE = 'global_trade_routes.zip'
+GLOBAL_ROUTES_CSV = 'global_trade_routes.csv'
 
 PORTS_BY_REGION = pd.read_csv('PORTS_BY_REGION.csv')
 '''
@@ -27,7 +36,7 @@ PORTS_BY_REGION = pd.read_csv('PORTS_BY_REGION.csv')
 185  Landing Sites    Eastern South America
 '''
 
-ITEMS_BY_PORT = pd.read_csv('ITEMS_BY_PORT.csv')
+ITEMS_BY_PORT = pd.read_csv(ITEMS_BY_PORT_FILE)
 '''
               Item   Port Name  Price
 0          Whiskey      London    810
@@ -55,7 +64,7 @@ against every trade region as a row. Regions with no ports with stores (e.g. Oce
 This is a matrix of the number of months of travel between regions.)
 '''
 
-ITEM_VALUE_BY_REGION = pd.read_csv('ITEM_VALUE_BY_REGION.csv', index_col=0)
+ITEM_VALUE_BY_REGION = pd.read_csv(ITEM_VALUE_BY_REGION_FILE, index_col=0)
 '''
 ITEM_VALUE_BY_REGION:
                 East Asia  ...  South America West Coast
@@ -109,6 +118,28 @@ def find_closest_port(input_str):
     else:
         return find_closest_match(input_str, valid_ports)
 
+def find_closest_item(input_str):
+    valid_items = ITEM_VALUE_BY_REGION.index.tolist()
+    if input_str in valid_items:
+        return input_str
+    else:
+        return find_closest_match(input_str, valid_items)
+
+def find_closest_region(input_str):
+    valid_regions = ITEM_VALUE_BY_REGION.columns.tolist()
+    if input_str in valid_regions:
+        return input_str
+    else:
+        return find_closest_match(input_str, valid_regions)
+
+# Writing the (possibly patched) data tables and trade routes back to disk
+
+def save_model(routes_df):
+    ITEMS_BY_PORT.to_csv(ITEMS_BY_PORT_FILE, index=False)
+    ITEM_VALUE_BY_REGION.to_csv(ITEM_VALUE_BY_REGION_FILE)
+    save_df_to_zip(routes_df, GLOBAL_ROUTES_FILE, GLOBAL_ROUTES_CSV)
+    print(f"Saved '{ITEMS_BY_PORT_FILE}', '{ITEM_VALUE_BY_REGION_FILE}' and '{GLOBAL_ROUTES_FILE}'.")
+
 # ---- CALCULATIONS ----
 
 # This function calculates the profit from buying an item at a source port and selling it at the destination port.
@@ -229,12 +260,12 @@ def calculate_all_routes_between_two_ports(port_A, port_B, profit_threshold=0):
     return pd.DataFrame(profitable_routes)
 
 def get_global_trade_routes(profit_threshold=0):
-    output_file = "global_trade_routes.zip"
+    output_file = GLOBAL_ROUTES_FILE
 
     # Check if the local zip file exists
     if os.path.exists(output_file):
         print(f"Loading global trade routes from '{output_file}'... (to perform all calculations fresh, delete this zip file before running the script)")
-        return load_df_from_zip(output_file, "global_trade_routes.csv")
+        return load_df_from_zip(output_file, GLOBAL_ROUTES_CSV)
 
     print(f"Performing one-time calculation of all global trade routes and saving to '{output_file}'. Please stand by, this may take some time.")
 
@@ -256,7 +287,7 @@ def get_global_trade_routes(profit_threshold=0):
     all_routes_df.rename(columns={'port1_port': 'port1_name', 'port2_port': 'port2_name'}, inplace=True)
 
     # Save the dataframe to a zip file
-    save_df_to_zip(all_routes_df, output_file, "global_trade_routes.csv")
+    save_df_to_zip(all_routes_df, output_file, GLOBAL_ROUTES_CSV)
 
     print(f"\nGlobal trade routes calculated and saved to '{output_file}'")
 
@@ -278,6 +309,297 @@ def pick_best_trade_routes(routes_df, num_results=10, specific_port=None, short_
     # Return the top num_results routes
     return filtered_routes.head(num_results)
 
+# ---- LIVE UPDATES ----
+
+# These are vectorized equivalents of calculate_profit and calculate_all_routes_between_two_ports. They produce the
+# same numbers, but only for the ports that are asked for, so that a price edit can patch the affected rows of the
+# global trade routes in milliseconds instead of regenerating the whole table.
+
+ROUTE_COLUMNS = ['port1_name', 'port1_item', 'port1_profit', 'port2_name', 'port2_item', 'port2_profit', 'range', 'profit_per_month']
+
+# Sale price of every item at every destination port, including the 10% / 80% availability penalties.
+def calculate_sale_prices(destination_ports=None, item_names=None):
+    items = ITEMS_BY_PORT.drop_duplicates(subset=['Item', 'Port Name'])
+    ports = PORTS_BY_REGION.drop_duplicates(subset=['Port'])
+    ports = ports[ports['Port'].isin(items['Port Name'])]
+
+    # Number of ports in each region where each item can be bought, and whether it can be bought at the port itself.
+    # Like calculate_profit, this counts every row of PORTS_BY_REGION, so a port listed twice counts as another port.
+    stocked = items.merge(PORTS_BY_REGION, left_on='Port Name', right_on='Port')[['Item', 'Port', 'Region']]
+    region_stock = stocked.groupby(['Item', 'Region']).size().rename('region_stock').reset_index()
+    stocked = stocked.drop_duplicates(subset=['Item', 'Port'])
+
+    if destination_ports is not None:
+        ports = ports[ports['Port'].isin(destination_ports)]
+
+    values = ITEM_VALUE_BY_REGION.rename_axis('Item').reset_index().melt(id_vars='Item', var_name='Region', value_name='Value')
+    if item_names is not None:
+        values = values[values['Item'].isin(item_names)]
+
+    sales = ports.merge(values, on='Region')
+    sales = sales.merge(region_stock, on=['Item', 'Region'], how='left')
+    sales = sales.merge(stocked[['Item', 'Port']].assign(stocked_here=True), on=['Item', 'Port'], how='left')
+
+    stocked_here = sales['stocked_here'].notna()
+    stocked_elsewhere = (sales['region_stock'].fillna(0) - stocked_here.astype(int)) > 0
+
+    # Lowered by 10% if available elsewhere in the region, otherwise lowered by 80% if available at the port itself
+    sale_prices = sales['Value'] * 1.0
+    sale_prices = sale_prices.mask(stocked_here, sales['Value'] * 0.2)
+    sale_prices = sale_prices.mask(stocked_elsewhere, sales['Value'] * 0.9)
+    sales['Sale Price'] = sale_prices
+
+    return sales[['Item', 'Port', 'Region', 'Sale Price']]
+
+# Profit of every one-way leg (buy an item at the source port, sell it at the destination port).
+def calculate_leg_profits(source_ports=None, destination_ports=None, item_name=None):
+    sources = ITEMS_BY_PORT.drop_duplicates(subset=['Item', 'Port Name'])
+    if source_ports is not None:
+        sources = sources[sources['Port Name'].isin(source_ports)]
+    if item_name is not None:
+        sources = sources[sources['Item'] == item_name]
+
+    sales = calculate_sale_prices(destination_ports, item_names=sources['Item'].unique())
+    legs = sources.merge(sales, on='Item')
+    legs = legs[legs['Port Name'] != legs['Port']]
+
+    return pd.DataFrame({
+        'source_port': legs['Port Name'],
+        'item': legs['Item'],
+        'destination_port': legs['Port'],
+        'profit': legs['Sale Price'] - legs['Price']
+    })
+
+# All round trip routes between any pair of ports where at least one of the ports is in the given list. With an
+# item_name, only the routes that buy that item at one of the given ports are returned.
+def calculate_routes_for_ports(ports, profit_threshold=0, item_name=None):
+    legs = pd.concat([calculate_leg_profits(source_ports=ports, item_name=item_name), calculate_leg_profits(destination_ports=ports)])
+    legs = legs.drop_duplicates(subset=['source_port', 'item', 'destination_port'])
+
+    # Routes are stored with the ports in alphabetical order, so pair each outbound leg with its return leg
+    outbound = legs[legs['source_port'] < legs['destination_port']].rename(columns={
+        'source_port': 'port1_name', 'item': 'port1_item', 'destination_port': 'port2_name', 'profit': 'port1_profit'})
+    inbound = legs[legs['source_port'] > legs['destination_port']].rename(columns={
+        'source_port': 'port2_name', 'item': 'port2_item', 'destination_port': 'port1_name', 'profit': 'port2_profit'})
+    routes = outbound.merge(inbound, on=['port1_name', 'port2_name'])
+
+    # Drop routes between regions that are not in the travel matrix, and look up the range of the rest
+    region_by_port = PORTS_BY_REGION.drop_duplicates(subset=['Port']).set_index('Port')['Region']
+    region1 = routes['port1_name'].map(region_by_port)
+    region2 = routes['port2_name'].map(region_by_port)
+    in_matrix = region1.isin(REGION_TRAVEL_MATRIX.columns) & region2.isin(REGION_TRAVEL_MATRIX.columns)
+    travel_ranges = REGION_TRAVEL_MATRIX.stack().reindex(pd.MultiIndex.from_arrays([region1[in_matrix], region2[in_matrix]]))
+    routes = routes[in_matrix].assign(range=travel_ranges.values)
+
+    total_profit = routes['port1_profit'] + routes['port2_profit']
+    routes = routes[~(total_profit <= profit_threshold)]
+    routes = routes.assign(profit_per_month=total_profit / (2 * routes['range']))
+
+    if item_name is not None:
+        # The return legs into the given ports can carry anything, so drop the pairs where neither leg is the item
+        routes = routes[(routes['port1_item'] == item_name) | (routes['port2_item'] == item_name)]
+
+    return routes[ROUTE_COLUMNS].reset_index(drop=True)
+
+# Replace every route involving one of the given ports with freshly calculated ones.
+def patch_trade_routes(routes_df, ports, profit_threshold=0):
+    affected = routes_df['port1_name'].isin(ports) | routes_df['port2_name'].isin(ports)
+    return pd.concat([routes_df[~affected], calculate_routes_for_ports(ports, profit_threshold)], ignore_index=True)
+
+def get_ports_in_region_of(port):
+    region_row = PORTS_BY_REGION[PORTS_BY_REGION['Port'] == port]
+    if region_row.empty:
+        raise ValueError(f"Port '{port}' not found in the PORTS_BY_REGION table.")
+    region = region_row['Region'].values[0]
+    return set(PORTS_BY_REGION[PORTS_BY_REGION['Region'] == region]['Port'])
+
+# Prices and values in the data tables are whole numbers
+def check_whole_number(value, field):
+    if isinstance(value, bool) or not isinstance(value, numbers.Integral):
+        raise ValueError(f"The {field} '{value}' is not a whole number.")
+
+# Each of these edits the in-memory data tables and returns the set of ports whose routes need to be recalculated.
+
+def set_item_price(item_name, port, price):
+    global ITEMS_BY_PORT
+    if item_name not in ITEM_VALUE_BY_REGION.index:
+        raise ValueError(f"The item '{item_name}' is not in the ITEM_VALUE_BY_REGION table.")
+    check_whole_number(price, 'price')
+    ports_in_region = get_ports_in_region_of(port)
+
+    stocked = (ITEMS_BY_PORT['Item'] == item_name) & (ITEMS_BY_PORT['Port Name'] == port)
+    if stocked.any():
+        # A new price only changes the profit of buying the item at this port
+        ITEMS_BY_PORT.loc[stocked, 'Price'] = price
+        return {port}
+
+    # A newly available item also changes the sale price penalties across the whole region
+    new_row = pd.DataFrame([{'Item': item_name, 'Port Name': port, 'Price': price}])
+    ITEMS_BY_PORT = pd.concat([ITEMS_BY_PORT, new_row], ignore_index=True)
+    return ports_in_region
+
+def remove_item_from_port(item_name, port):
+    global ITEMS_BY_PORT
+    stocked = (ITEMS_BY_PORT['Item'] == item_name) & (ITEMS_BY_PORT['Port Name'] == port)
+    if not stocked.any():
+        raise ValueError(f"The item '{item_name}' is not available at the port '{port}'.")
+    ports_in_region = get_ports_in_region_of(port)
+
+    ITEMS_BY_PORT = ITEMS_BY_PORT[~stocked].reset_index(drop=True)
+    return ports_in_region
+
+def set_item_value(item_name, region, value):
+    if item_name not in ITEM_VALUE_BY_REGION.index:
+        raise ValueError(f"The item '{item_name}' is not in the ITEM_VALUE_BY_REGION table.")
+    if region not in ITEM_VALUE_BY_REGION.columns:
+        raise ValueError(f"The region '{region}' is not in the ITEM_VALUE_BY_REGION table.")
+    check_whole_number(value, 'value')
+
+    ITEM_VALUE_BY_REGION.loc[item_name, region] = value
+    return set(PORTS_BY_REGION[PORTS_BY_REGION['Region'] == region]['Port'])
+
+UPDATE_HANDLERS = {
+    'price': set_item_price,    # ('price', item_name, port, price), also makes the item available there
+    'remove': remove_item_from_port,    # ('remove', item_name, port)
+    'value': set_item_value,    # ('value', item_name, region, value)
+}
+
+UPDATE_FIELDS = {
+    'price': ['item_name', 'port', 'price'],
+    'remove': ['item_name', 'port'],
+    'value': ['item_name', 'region', 'value'],
+}
+
+# Apply a batch of updates to the data tables and return the patched trade routes. If any update fails, the data
+# tables are left as they were and a ValueError is raised. With persist=True the patch is also written to disk.
+def apply_updates(routes_df, updates, persist=False, profit_threshold=0):
+    global ITEMS_BY_PORT, ITEM_VALUE_BY_REGION
+    items_backup = ITEMS_BY_PORT.copy()
+    values_backup = ITEM_VALUE_BY_REGION.copy()
+
+    affected_ports = set()
+    try:
+        for kind, *args in updates:
+            if kind not in UPDATE_HANDLERS:
+                raise ValueError(f"Unknown update '{kind}', expected one of: {', '.join(UPDATE_HANDLERS)}.")
+            if len(args) != len(UPDATE_FIELDS[kind]):
+                raise ValueError(f"Update '{kind}' expects the fields: {', '.join(UPDATE_FIELDS[kind])}.")
+            affected_ports |= UPDATE_HANDLERS[kind](*args)
+
+        routes_df = patch_trade_routes(routes_df, affected_ports, profit_threshold)
+        update_item_index(list({item_name for _, item_name, *_ in updates}))
+    except Exception:
+        ITEMS_BY_PORT = items_backup
+        ITEM_VALUE_BY_REGION = values_backup
+        raise
+
+    if persist:
+        save_model(routes_df)
+
+    return routes_df
+
+# Turns e.g. "price Gold, London, 5000; remove Gin, Amsterdam; value Gold, Britain, 9000" into a list of updates.
+# Names are fuzzy matched just like port names in the prompt.
+def parse_updates(command):
+    updates = []
+    for part in command.split(';'):
+        kind, _, args = part.strip().partition(' ')
+        args = [arg.strip() for arg in args.split(',')]
+
+        # Empty names would otherwise be fuzzy matched to a guess
+        if not all(args[:2]):
+            raise ValueError(f"Could not understand the update '{part.strip()}'.")
+
+        if kind == 'price' and len(args) == 3:
+            updates.append(('price', find_closest_item(args[0]), find_closest_port(args[1]), int(args[2])))
+        elif kind == 'remove' and len(args) == 2:
+            updates.append(('remove', find_closest_item(args[0]), find_closest_port(args[1])))
+        elif kind == 'value' and len(args) == 3:
+            updates.append(('value', find_closest_item(args[0]), find_closest_region(args[1]), int(args[2])))
+        else:
+            raise ValueError(f"Could not understand the update '{part.strip()}'.")
+
+    return updates
+
+# Shows what a (fuzzy matched) update resolved to, e.g. "value Gold @ Netherlands = 9000"
+def describe_update(update):
+    kind, item_name, target, *value = update
+    description = f"{kind} {item_name} @ {target}"
+    if value:
+        description += f" = {value[0]}"
+    return description
+
+# ---- ITEM INDEX ----
+
+# Inverted index from each item to the ports where it can be bought (cheapest first) and the ports where it can be
+# sold (highest sale price after the availability penalties first). It is built on first use and kept up to date by
+# apply_updates, so item queries never have to scan the global trade routes.
+ITEM_INDEX = {}
+'''
+ITEM_INDEX['Gold']:
+{'buy_ports':     Port Name       Region  Price
+                0  St. George  West Africa   4050
+                ...
+ 'sell_ports':          Port      Region  Sale Price
+                0  Amsterdam  Netherlands      9000.0
+                ...}
+'''
+
+def build_item_index(item_names):
+    region_by_port = PORTS_BY_REGION.drop_duplicates(subset=['Port']).set_index('Port')['Region']
+    buy_ports = ITEMS_BY_PORT[ITEMS_BY_PORT['Item'].isin(item_names)].drop_duplicates(subset=['Item', 'Port Name'])
+    buy_ports = buy_ports.assign(Region=buy_ports['Port Name'].map(region_by_port))
+    buy_ports = buy_ports.sort_values(by=['Price', 'Port Name'])[['Item', 'Port Name', 'Region', 'Price']]
+
+    sell_ports = calculate_sale_prices(item_names=item_names)
+    sell_ports = sell_ports.sort_values(by=['Sale Price', 'Port'], ascending=[False, True])
+
+    # Sorting once and then grouping keeps every item's ports in sorted order
+    buy_groups = dict(tuple(buy_ports.groupby('Item')))
+    sell_groups = dict(tuple(sell_ports.groupby('Item')))
+
+    index = {}
+    for item_name in item_names:
+        index[item_name] = {
+            'buy_ports': buy_groups.get(item_name, buy_ports.head(0))[['Port Name', 'Region', 'Price']].reset_index(drop=True),
+            'sell_ports': sell_groups.get(item_name, sell_ports.head(0))[['Port', 'Region', 'Sale Price']].reset_index(drop=True)
+        }
+    return index
+
+def update_item_index(item_names):
+    # Nothing to update until the index has been built
+    if ITEM_INDEX:
+        ITEM_INDEX.update(build_item_index(item_names))
+
+def get_item_index():
+    if not ITEM_INDEX:
+        ITEM_INDEX.update(build_item_index(ITEM_VALUE_BY_REGION.index.tolist()))
+    return ITEM_INDEX
+
+# All profitable routes that carry the given item in at least one direction. These are calculated from the ports in
+# the item index rather than filtered out of the global trade routes, and can be narrowed down further with
+# pick_best_trade_routes.
+def get_item_trade_routes(item_name, profit_threshold=0):
+    buy_ports = get_item_index()[item_name]['buy_ports']['Port Name']
+    return calculate_routes_for_ports(set(buy_ports), profit_threshold, item_name=item_name)
+
+def print_item_summary(item_name, num_to_display=10):
+    entry = get_item_index()[item_name]
+
+    print(f"Cheapest ports to buy '{item_name}':")
+    if entry['buy_ports'].empty:
+        print("  There are no records to display.")
+    for _, row in entry['buy_ports'].head(num_to_display).iterrows():
+        print(f"  {row['Port Name']} ({row['Region']}), {row['Price']}")
+    print()
+
+    print(f"Best ports to sell '{item_name}':")
+    if entry['sell_ports'].empty:
+        print("  There are no records to display.")
+    for _, row in entry['sell_ports'].head(num_to_display).iterrows():
+        print(f"  {row['Port']} ({row['Region']}), {round(row['Sale Price'], 1)}")
+    print()
+
 
 def print_routes(routes, num_to_display=10):
     # Check if the dataframe is empty
@@ -338,6 +660,35 @@ def print_routes(routes, num_to_display=10):
 
     print()
 
+def show_trade_routes(global_routes, port_input, short_range_only, item_input=None):
+    # Item queries show where to buy and sell the item, followed by the routes carrying it
+    if item_input:
+        print_item_summary(item_input, num_to_display=NUM_ITEM_PORTS_PROMPT)
+        global_routes = get_item_trade_routes(item_input)
+
+    # Determine the number of results to display
+    if item_input:
+        num_to_display = NUM_TOP_ROUTES_PROMPT
+        description = f"Showing the top {NUM_TOP_ROUTES_PROMPT} trade routes carrying '{item_input}':"
+    elif port_input:
+        num_to_display = NUM_TOP_ROUTES_PROMPT
+        description = f"Showing the top {NUM_TOP_ROUTES_PROMPT} trade routes for port '{port_input}':"
+    else:
+        num_to_display = NUM_WORLDWIDE_ROUTES
+        description = f"Showing all {NUM_WORLDWIDE_ROUTES} trade routes globally:"
+
+    if short_range_only:
+        description += " (Short Range Only)"
+
+    print(description)
+
+    # Pick the best trade routes
+    best_routes = pick_best_trade_routes(global_routes, num_results=NUM_RESULTS_TO_PICK, specific_port=port_input,
+                                         short_range_only=short_range_only)
+
+    # Print the routes
+    print_routes(best_routes, num_to_display=num_to_display)
+
 def main():
     # Clear the screen
     os.system('cls' if os.name == 'nt' else 'clear')
@@ -345,15 +696,58 @@ def main():
     global_routes = get_global_trade_routes()
     print(" ")
 
+    # The last query, which is shown again after applying updates
+    port_input = ''
+    item_input = None
+    short_range_only = False
+
     while True:
         # Prompt user for input
-        port_input = input(f"- Enter a port to get the top {NUM_TOP_ROUTES_PROMPT} trade routes from that port,\n"
+        user_input = input(f"- Enter a port to get the top {NUM_TOP_ROUTES_PROMPT} trade routes from that port,\n"
                             f"- Leave blank for the top {NUM_WORLDWIDE_ROUTES} trade routes worldwide \n"
                             f"- Add an asterisk (*) to only show short range routes (no Charting Office)\n"
+                            f"- Type 'item <item>' for the best ports to buy and sell an item and the top\n"
+                            f"  {NUM_TOP_ROUTES_PROMPT} trade routes carrying it.\n"
                             f"- Your spelling does not have to be exact, it will guess the port you meant.\n"
+                            f"- Update the data with 'price <item>, <port>, <price>', 'remove <item>, <port>' or\n"
+                            f"  'value <item>, <region>, <value>'. Separate several updates with ';' and add an\n"
+                            f"  exclamation mark (!) to also save them to disk, or type 'save' to save all updates.\n"
                             f"- Type 'exit' to exit.\n"
                             f"> ")
 
+        if user_input == 'exit':
+            break
+
+        # Check for data updates, which patch the global trade routes and show the last query again
+        if user_input == 'save' or user_input.split(' ', 1)[0] in UPDATE_HANDLERS:
+            os.system('cls' if os.name == 'nt' else 'clear')
+            try:
+                if user_input == 'save':
+                    save_model(global_routes)
+                else:
+                    persist = user_input.endswith('!')
+                    updates = parse_updates(user_input.rstrip('!'))
+                    for update in updates:
+                        print(f"  {describe_update(update)}")
+                    start_time = time.perf_counter()
+                    global_routes = apply_updates(global_routes, updates, persist=persist)
+                    elapsed_ms = (time.perf_counter() - start_time) * 1000
+                    print(f"Applied {len(updates)} update(s) in {elapsed_ms:.0f} ms.")
+            except ValueError as e:
+                print(f"Update failed: {e}")
+            print()
+            show_trade_routes(global_routes, port_input, short_range_only, item_input)
+            continue
+
+        # An item query needs an item name, otherwise it would guess one
+        if user_input.split(' ', 1)[0] == 'item' and not user_input[len('item'):].rstrip('*').strip():
+            os.system('cls' if os.name == 'nt' else 'clear')
+            print("Usage: 'item <item>', for example 'item Gold' or 'item Gold*' for short range routes only.\n")
+            continue
+
+        port_input = user_input
+        item_input = None
+
         # Check for short range option
         if port_input.endswith('*'):
             port_input = port_input.rstrip('*')
@@ -361,34 +755,16 @@ def main():
         else:
             short_range_only = False
 
-        if port_input == 'exit':
-            break
-
         # Clear the screen
         os.system('cls' if os.name == 'nt' else 'clear')
 
-        if port_input:
+        if port_input.split(' ', 1)[0] == 'item':
+            item_input = find_closest_item(port_input.split(' ', 1)[-1].strip())
+            port_input = ''
+        elif port_input:
             port_input = find_closest_port(port_input)
 
-        # Determine the number of results to display
-        if port_input:
-            num_to_display = NUM_TOP_ROUTES_PROMPT
-            description = f"Showing the top {NUM_TOP_ROUTES_PROMPT} trade routes for port '{port_input}':"
-        else:
-            num_to_display = NUM_WORLDWIDE_ROUTES
-            description = f"Showing all {NUM_WORLDWIDE_ROUTES} trade routes globally:"
-
-        if short_range_only:
-            description += " (Short Range Only)"
-
-        print(description)
-
-        # Pick the best trade routes
-        best_routes = pick_best_trade_routes(global_routes, num_results=NUM_RESULTS_TO_PICK, specific_port=port_input,
-                                             short_range_only=short_range_only)
-
-        # Print the routes
-        print_routes(best_routes, num_to_display=num_to_display)
+        show_trade_routes(global_routes, port_input, short_range_only, item_input)
 
 if __name__ == "__main__":
     main()